@@ -1,31 +1,56 @@
 # app/api/routes/health.py
 
-from fastapi import APIRouter, Request
-from datetime import datetime
+import time
+import orjson
+from fastapi import APIRouter, Request, Response
+from datetime import datetime, timezone
 from app.models.health import HealthResponse
 from app.core.config import settings
 from app.core.rate_limiter import limiter
 
 router = APIRouter(tags=["Health"])
 
+# The service info never changes, so it is serialized once at import
+ROOT_BODY = orjson.dumps({
+    "service": settings.APP_NAME,
+    "version": settings.VERSION,
+    "status": "operational",
+    "docs": "/api/docs",
+    "health": "/health",
+})
+
+
+# /health body, re-serialized at most once per second
+_health_second = 0
+_health_body = b""
+
+
+def health_body() -> bytes:
+    global _health_second, _health_body
+
+    now = int(time.time())
+    if now != _health_second:
+        # Naive UTC, same format as the former utcfromtimestamp()
+        timestamp = datetime.fromtimestamp(now, timezone.utc)
+        _health_body = orjson.dumps({
+            "status": "healthy",
+            "timestamp": timestamp.replace(tzinfo=None),
+            "version": settings.VERSION,
+        })
+        _health_second = now
+
+    return _health_body
+
 
 @router.get("/")
 @limiter.limit(settings.RATE_LIMIT_ANONYMOUS)
 async def root(request: Request):
-    return {
-        "service": settings.APP_NAME,
-        "version": settings.VERSION,
-        "status": "operational",
-        "docs": "/api/docs",
-        "health": "/health",
-    }
+    return Response(content=ROOT_BODY, media_type="application/json")
 
 
 @router.get("/health", response_model=HealthResponse)
 @limiter.limit(settings.RATE_LIMIT_ANONYMOUS)
 async def health_check(request: Request):
-    return HealthResponse(
-        status="healthy",
-        timestamp=datetime.utcnow(),
-        version=settings.VERSION,
-    )
+    # Returned directly so liveness probes skip response-model
+    # validation; the shape is still documented by HealthResponse
+    return Response(content=health_body(), media_type="application/json")
@@ -4,13 +4,10 @@ from fastapi import APIRouter, Request
 from app.models.health import MetricsResponse
 from app.core.config import settings
 from app.core.rate_limiter import limiter
-from app.services.cache import SimpleCache
+from app.services.cache import cache
 
 router = APIRouter(prefix="/metrics", tags=["Monitoring"])
 
-# Shared cache instance (same as pipelines)
-cache = SimpleCache()
-
 
 @router.get("", response_model=MetricsResponse)
 @limiter.limit("20/minute")
@@ -2,11 +2,16 @@
 
 import time
 import logging
+from typing import Hashable, List, Optional, Tuple
+from anyio import to_thread
 from fastapi import APIRouter, Request, status, HTTPException
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
 from app.models.pipeline import Pipeline, PipelineResponse
-from app.services.pipeline_analyzer import analyze_pipeline
-from app.services.cache import SimpleCache
-from app.utils.hashing import generate_cache_key
+from app.services.pipeline_analyzer import analyze_graph
+from app.services.pipeline_parser import ParsedPipeline, parse_pipeline_json
+from app.services.cache import cache, rejections
+from app.utils.hashing import body_cache_key, parsed_cache_key
 from app.core.config import settings
 from app.core.rate_limiter import limiter
 
@@ -16,58 +21,155 @@ router = APIRouter(
 )
 
 logger = logging.getLogger(__name__)
-cache = SimpleCache()
+
+
+def _inline_defs(schema: dict) -> dict:
+    """
+    Inline the local $defs of a Pydantic JSON schema so it can be used
+    as a standalone OpenAPI request body schema.
+    """
+
+    defs = schema.pop("$defs", {})
+
+    def resolve(node):
+        if isinstance(node, dict):
+            ref = node.get("$ref", "")
+            if ref.startswith("#/$defs/"):
+                return resolve(defs[ref.rsplit("/", 1)[-1]])
+            return {key: resolve(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [resolve(item) for item in node]
+        return node
+
+    return resolve(schema)
+
+
+# The body is parsed by parse_pipeline_json, not by FastAPI, so the
+# request schema is documented explicitly
+PIPELINE_REQUEST_BODY = {
+    "required": True,
+    "content": {
+        "application/json": {
+            "schema": _inline_defs(Pipeline.model_json_schema()),
+        },
+    },
+}
+
+
+def parse_body(raw: bytes) -> ParsedPipeline:
+    """
+    Parse a request body, refusing recently rejected bodies from the
+    rejections cache with the same errors instead of parsing them again.
+    """
+
+    # Small bodies are cheaper to re-parse than to hash and look up
+    if (
+        not settings.ENABLE_CACHING
+        or len(raw) < settings.CACHE_NEGATIVE_MIN_BYTES
+    ):
+        return parse_pipeline_json(raw)
+
+    body_key = body_cache_key(raw)
+    errors = rejections.get(body_key)
+    if errors is not None:
+        raise RequestValidationError(errors)
+
+    try:
+        return parse_pipeline_json(raw)
+    except RequestValidationError as exc:
+        rejections.set(body_key, exc.errors())
+        raise
+
+
+async def run_analysis(
+    request: Request,
+    pipeline: ParsedPipeline,
+    cache_key: Optional[Hashable] = None,
+):
+    """
+    Run the CPU-bound analysis off the event loop.
+
+    Large pipelines get a worker thread of their own (the kernels
+    release the GIL); everything else goes through the lifespan
+    batcher, or straight to the default thread pool when there is none.
+    """
+
+    batcher = getattr(request.app.state, "batcher", None)
+    is_large = len(pipeline.node_ids) >= settings.LARGE_PIPELINE_MIN_NODES
+
+    if batcher is not None and not is_large:
+        return await batcher.submit(cache_key, pipeline)
+
+    return await to_thread.run_sync(
+        analyze_graph, pipeline.node_ids, pipeline.sources, pipeline.targets
+    )
+
+
+def analysis_response(
+    result: Tuple[int, int, bool, Optional[List[str]]],
+    cache_hit: bool,
+    start_ns: int,
+) -> ORJSONResponse:
+    """
+    Serialize an analysis result directly; the payload is built by us,
+    so it skips PipelineResponse validation.
+    """
+
+    num_nodes, num_edges, is_dag, cycle = result
+    return ORJSONResponse({
+        "num_nodes": num_nodes,
+        "num_edges": num_edges,
+        "is_dag": is_dag,
+        "cycle": cycle,
+        "cache_hit": cache_hit,
+        "process_time": (time.perf_counter_ns() - start_ns) / 1e9,
+    })
 
 
 @router.post(
     "/parse",
-    response_model=PipelineResponse,
+    # PipelineResponse only documents the response shape
+    response_model=None,
+    responses={200: {"model": PipelineResponse}},
     status_code=status.HTTP_200_OK,
+    openapi_extra={"requestBody": PIPELINE_REQUEST_BODY},
 )
 @limiter.limit(settings.RATE_LIMIT_PARSE)
-async def parse_pipeline(request: Request, pipeline: Pipeline):
-    start_time = time.time()
-    cache_hit = False
+async def parse_pipeline(request: Request):
+    start_ns = time.perf_counter_ns()
+
+    # Validated straight from the raw body; no Node / Edge models are
+    # built unless the payload is invalid
+    pipeline = parse_body(await request.body())
+
+    # Small pipelines are cheaper to re-analyze than to hash
+    use_cache = (
+        settings.ENABLE_CACHING
+        and len(pipeline.node_ids) >= settings.CACHE_MIN_NODES
+    )
+    cache_key = None
 
     try:
-        if settings.ENABLE_CACHING:
-            cache_key = generate_cache_key(pipeline)
+        if use_cache:
+            cache_key = parsed_cache_key(pipeline)
             cached = cache.get(cache_key)
 
             if cached is not None:
-                cache_hit = True
-                num_nodes, num_edges, is_dag, cycle = cached
-                return PipelineResponse(
-                    num_nodes=num_nodes,
-                    num_edges=num_edges,
-                    is_dag=is_dag,
-                    cycle=cycle,
-                    cache_hit=True,
-                    process_time=time.time() - start_time,
-                )
-
-        logger.info(
+                return analysis_response(cached, True, start_ns)
+
+        # Per-request line already comes from the logging middleware
+        logger.debug(
             "Analyzing pipeline | nodes=%s edges=%s",
-            len(pipeline.nodes),
-            len(pipeline.edges),
+            len(pipeline.node_ids),
+            len(pipeline.sources),
         )
 
-        num_nodes, num_edges, is_dag, cycle = analyze_pipeline(pipeline)
-
-        if settings.ENABLE_CACHING:
-            cache.set(
-                cache_key,
-                (num_nodes, num_edges, is_dag, cycle),
-            )
-
-        return PipelineResponse(
-            num_nodes=num_nodes,
-            num_edges=num_edges,
-            is_dag=is_dag,
-            cycle=cycle,
-            cache_hit=cache_hit,
-            process_time=time.time() - start_time,
-        )
+        result = await run_analysis(request, pipeline, cache_key)
+
+        if use_cache:
+            cache.set(cache_key, result)
+
+        return analysis_response(result, False, start_ns)
 
     except HTTPException:
         raise
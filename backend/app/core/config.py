@@ -18,12 +18,65 @@ class Settings:
     # ===============================
     ENABLE_CACHING: bool = True
     CACHE_TTL: int = 300  # seconds
+    CACHE_MAX_ENTRIES: int = int(os.getenv("CACHE_MAX_ENTRIES", 1_000))
+    # Independently locked partitions; must be a power of two
+    CACHE_SHARDS: int = int(os.getenv("CACHE_SHARDS", 16))
+    # Below this size re-analysis is cheaper than hashing the pipeline
+    CACHE_MIN_NODES: int = 16
+    # Below this many nodes + edges the sorted ids are the key, unhashed
+    CACHE_DIRECT_KEY_MAX_SIZE: int = 64
+    # Rejected request bodies of at least CACHE_NEGATIVE_MIN_BYTES are
+    # remembered for CACHE_NEGATIVE_TTL seconds, so a retried bad payload
+    # is refused without being parsed again
+    CACHE_NEGATIVE_TTL: int = 30
+    CACHE_NEGATIVE_MAX_ENTRIES: int = 256
+    CACHE_NEGATIVE_MIN_BYTES: int = 4096
 
     # ===============================
     # RATE LIMITING
     # ===============================
     RATE_LIMIT_ANONYMOUS: str = "100/minute"
     RATE_LIMIT_PARSE: str = "50/minute"
+    # Counters are per process with "memory://"; point this at Redis
+    # (e.g. "redis://localhost:6379/0") to share limits across workers
+    # and replicas. slowapi only drives the synchronous limits storage,
+    # so in Redis mode every rate-limited request makes a blocking Redis
+    # round trip on the event loop thread; keep Redis close to the app
+    RATE_LIMIT_STORAGE_URI: str = os.getenv(
+        "RATE_LIMIT_STORAGE_URI",
+        "memory://"
+    )
+    RATE_LIMIT_STRATEGY: str = os.getenv(
+        "RATE_LIMIT_STRATEGY",
+        "fixed-window"
+    )
+
+    # ===============================
+    # CONCURRENCY
+    # ===============================
+    # Pipelines with at least this many nodes skip the batcher and get
+    # a worker thread of their own, so they never hold up a batch
+    LARGE_PIPELINE_MIN_NODES: int = 5_000
+    # Concurrent smaller pipelines are analyzed in batches of up to
+    # BATCH_MAX_SIZE; a batch waits at most BATCH_MAX_WAIT_MS for more
+    # requests (0 = only take what is already queued)
+    BATCH_MAX_SIZE: int = 16
+    # Batches analyzed concurrently on worker threads; the kernels
+    # release the GIL, so they overlap across cores
+    BATCH_MAX_IN_FLIGHT: int = int(
+        os.getenv("BATCH_MAX_IN_FLIGHT", os.cpu_count() or 1)
+    )
+    BATCH_MAX_WAIT_MS: float = float(os.getenv("BATCH_MAX_WAIT_MS", 0))
+
+    # ===============================
+    # COMPRESSION
+    # ===============================
+    # Small JSON bodies (health, metrics, most parse results) cost more
+    # CPU to compress than they save in bandwidth
+    GZIP_MINIMUM_SIZE: int = 4096
+    # Level 4 matches level 9's size on large cycle responses at about
+    # a third of the CPU (GZipMiddleware defaults to 9)
+    GZIP_COMPRESS_LEVEL: int = 4
 
     # ===============================
     # CORS
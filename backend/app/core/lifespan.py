@@ -4,6 +4,8 @@ from contextlib import asynccontextmanager
 import logging
 from fastapi import FastAPI
 from app.core.config import settings
+from app.services._cycle_numba import warm_up
+from app.services.batcher import AnalysisBatcher
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +19,17 @@ async def lifespan(app: FastAPI):
         settings.ENABLE_CACHING,
     )
 
+    # Compile the cycle-detection kernel before serving traffic
+    warm_up()
+
+    app.state.batcher = AnalysisBatcher(
+        max_batch_size=settings.BATCH_MAX_SIZE,
+        max_wait=settings.BATCH_MAX_WAIT_MS / 1000,
+        max_in_flight=settings.BATCH_MAX_IN_FLIGHT,
+    )
+    app.state.batcher.start()
+
     yield
 
     logger.info("Shutting down %s", settings.APP_NAME)
+    await app.state.batcher.stop()
@@ -1,16 +1,52 @@
 # app/core/logging.py
 
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
 LOG_FORMAT = (
     "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
 )
 
+class DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler that enqueues records unformatted.
+
+    The stock prepare() formats the message (and any traceback) on the
+    calling thread so records can be pickled; the queue here never
+    leaves the process, so formatting is left to the listener thread.
+    Arguments are interpolated late, so log values rather than objects
+    that are mutated right after the call.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
 def setup_logging(level: int = logging.INFO) -> None:
-    logging.basicConfig(
-        level=level,
-        format=LOG_FORMAT,
-    )
+    root = logging.getLogger()
+
+    # Like logging.basicConfig, leave an already configured root alone
+    if not root.handlers:
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+        # Request handlers only enqueue records; message interpolation,
+        # formatting and the write (under the handler lock) all happen
+        # on the listener thread
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        listener = QueueListener(
+            log_queue,
+            stream_handler,
+            respect_handler_level=True,
+        )
+        listener.start()
+        atexit.register(listener.stop)
+
+        root.addHandler(DeferredQueueHandler(log_queue))
+
+    root.setLevel(level)
 
     # Reduce noise from third-party libs
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
@@ -1,10 +1,58 @@
 # app/core/rate_limiter.py
 
-from slowapi import Limiter, _rate_limit_exceeded_handler
+from fastapi import Request
+from fastapi.responses import ORJSONResponse
+from slowapi import Limiter
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
+from app.core.config import settings
+
+def remote_address(request: Request) -> str:
+    """
+    Client address resolved once by RemoteAddressMiddleware, falling
+    back to slowapi's lookup when the middleware is not installed.
+    """
+
+    try:
+        return request.state.remote_addr
+    except AttributeError:
+        return get_remote_address(request)
+
+
+def build_limiter(storage_uri: str, strategy: str) -> Limiter:
+    """
+    Create the application Limiter for a limits storage URI
+    ("memory://", "redis://...") and strategy name.
+    """
+
+    return Limiter(
+        key_func=remote_address,
+        storage_uri=storage_uri,
+        strategy=strategy,
+    )
+
+
+limiter = build_limiter(
+    settings.RATE_LIMIT_STORAGE_URI,
+    settings.RATE_LIMIT_STRATEGY,
+)
+
+
+def rate_limit_exceeded_handler(
+    request: Request,
+    exc: RateLimitExceeded,
+) -> ORJSONResponse:
+    """
+    Same response as slowapi's default handler, serialized with orjson.
+    """
+
+    response = ORJSONResponse(
+        {"error": f"Rate limit exceeded: {exc.detail}"},
+        status_code=429,
+    )
+    return request.app.state.limiter._inject_headers(
+        response, request.state.view_rate_limit
+    )
 
-limiter = Limiter(key_func=get_remote_address)
 
-rate_limit_exceeded_handler = _rate_limit_exceeded_handler
 rate_limit_exception = RateLimitExceeded
@@ -1,3 +1,4 @@
 # app/middleware/__init__.py
 
 from .logging import RequestLoggingMiddleware
+from .remote_address import RemoteAddressMiddleware
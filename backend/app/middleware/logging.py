@@ -4,6 +4,7 @@ import time
 import logging
 from fastapi import Request
 from starlette.middleware.base import BaseHTTPMiddleware
+from app.core.rate_limiter import remote_address
 
 logger = logging.getLogger(__name__)
 
@@ -14,42 +15,45 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
     """
 
     async def dispatch(self, request: Request, call_next):
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
-        client_host = request.client.host if request.client else "unknown"
-        method = request.method
-        path = request.url.path
+        # Skip building log arguments when INFO is filtered out
+        log_info = logger.isEnabledFor(logging.INFO)
 
-        logger.info(
-            "%s %s | client=%s",
-            method,
-            path,
-            client_host,
-        )
+        if log_info:
+            logger.info(
+                "%s %s | client=%s",
+                request.method,
+                request.url.path,
+                remote_address(request),
+            )
 
         try:
             response = await call_next(request)
-            process_time = time.time() - start_time
-
-            response.headers["X-Process-Time"] = f"{process_time:.6f}"
+            elapsed_ns = time.perf_counter_ns() - start_ns
 
-            logger.info(
-                "%s %s | status=%s | %.3fs",
-                method,
-                path,
-                response.status_code,
-                process_time,
+            response.headers["X-Process-Time"] = (
+                f"{elapsed_ns / 1_000_000_000:.6f}"
             )
 
+            if log_info:
+                logger.info(
+                    "%s %s | status=%s | %.3fs",
+                    request.method,
+                    request.url.path,
+                    response.status_code,
+                    elapsed_ns * 1e-9,
+                )
+
             return response
 
         except Exception:
-            process_time = time.time() - start_time
+            elapsed_ns = time.perf_counter_ns() - start_ns
 
             logger.exception(
                 "%s %s | failed after %.3fs",
-                method,
-                path,
-                process_time,
+                request.method,
+                request.url.path,
+                elapsed_ns * 1e-9,
             )
             raise
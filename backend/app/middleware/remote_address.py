@@ -0,0 +1,26 @@
+# app/middleware/remote_address.py
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class RemoteAddressMiddleware:
+    """
+    Resolves the client address once per request and stores it as
+    request.state.remote_addr for the logging middleware and the rate
+    limiter key function.
+
+    Plain ASGI middleware, so it adds no per-request Request object or
+    task the way BaseHTTPMiddleware does.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] == "http":
+            client = scope.get("client")
+            scope.setdefault("state", {})["remote_addr"] = (
+                client[0] if client else "unknown"
+            )
+
+        await self.app(scope, receive, send)
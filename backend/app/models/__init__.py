@@ -1,4 +1,10 @@
 # app/models/__init__.py
 
-from .pipeline import Node, Edge, Pipeline, PipelineResponse
+from .pipeline import (
+    Node,
+    Edge,
+    Pipeline,
+    PipelineResponse,
+    PIPELINE_ADAPTER,
+)
 from .health import HealthResponse, MetricsResponse
@@ -1,45 +1,68 @@
 # app/models/pipeline.py
 
-from pydantic import BaseModel, Field, validator
-from typing import List, Dict, Any, Optional
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    StringConstraints,
+    TypeAdapter,
+    field_validator,
+    model_validator,
+)
+from operator import attrgetter
+from typing import Annotated, List, Dict, Any, Optional
 from app.core.config import settings
 
 
+# Length / emptiness checks run inside pydantic-core
+NodeId = Annotated[
+    str,
+    StringConstraints(min_length=1, max_length=settings.MAX_NODE_ID_LENGTH),
+]
+NonEmptyStr = Annotated[str, StringConstraints(min_length=1)]
+
+_get_id = attrgetter("id")
+
+
 # ===============================
 # CORE ENTITIES
 # ===============================
 
 class Node(BaseModel):
-    id: str = Field(..., description="Unique identifier for the node")
-    type: str = Field(..., description="Node type")
+    model_config = ConfigDict(frozen=True)
+
+    id: NodeId = Field(..., description="Unique identifier for the node")
+    type: NonEmptyStr = Field(..., description="Node type")
     data: Dict[str, Any] = Field(default_factory=dict)
 
-    @validator("id")
+    @field_validator("id")
+    @classmethod
     def validate_id(cls, v: str) -> str:
-        if not v.strip():
+        # Whitespace-only IDs pass min_length
+        if v.isspace():
             raise ValueError("Node ID cannot be empty")
-        if len(v) > settings.MAX_NODE_ID_LENGTH:
-            raise ValueError(
-                f"Node ID exceeds max length {settings.MAX_NODE_ID_LENGTH}"
-            )
         return v
 
-    @validator("type")
+    @field_validator("type")
+    @classmethod
     def validate_type(cls, v: str) -> str:
-        if not v.strip():
+        if v.isspace():
             raise ValueError("Node type cannot be empty")
         return v
 
 
 class Edge(BaseModel):
-    source: str = Field(..., description="Source node ID")
-    target: str = Field(..., description="Target node ID")
+    model_config = ConfigDict(frozen=True)
+
+    source: NonEmptyStr = Field(..., description="Source node ID")
+    target: NonEmptyStr = Field(..., description="Target node ID")
     sourceHandle: Optional[str] = None
     targetHandle: Optional[str] = None
 
-    @validator("source", "target")
+    @field_validator("source", "target")
+    @classmethod
     def validate_refs(cls, v: str) -> str:
-        if not v.strip():
+        if v.isspace():
             raise ValueError("Edge references cannot be empty")
         return v
 
@@ -49,30 +72,31 @@ class Edge(BaseModel):
 # ===============================
 
 class Pipeline(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     nodes: List[Node]
     edges: List[Edge]
 
-    @validator("nodes")
+    @field_validator("nodes")
+    @classmethod
     def validate_nodes(cls, nodes: List[Node]) -> List[Node]:
-        if nodes is None:
-            raise ValueError("nodes must be provided")
-
         if len(nodes) > settings.MAX_NODES:
             raise ValueError(
                 f"Pipeline exceeds max nodes ({settings.MAX_NODES})"
             )
 
-        ids = [n.id for n in nodes]
-        if len(ids) != len(set(ids)):
-            raise ValueError("Duplicate node IDs detected")
+        # Single pass that stops at the first duplicate
+        seen = set()
+        for node_id in map(_get_id, nodes):
+            if node_id in seen:
+                raise ValueError("Duplicate node IDs detected")
+            seen.add(node_id)
 
         return nodes
 
-    @validator("edges")
+    @field_validator("edges")
+    @classmethod
     def validate_edges(cls, edges: List[Edge]) -> List[Edge]:
-        if edges is None:
-            raise ValueError("edges must be provided")
-
         if len(edges) > settings.MAX_EDGES:
             raise ValueError(
                 f"Pipeline exceeds max edges ({settings.MAX_EDGES})"
@@ -80,6 +104,29 @@ class Pipeline(BaseModel):
 
         return edges
 
+    @model_validator(mode="after")
+    def validate_refs(self) -> "Pipeline":
+        # Runs once nodes and edges are valid; the analyzer relies on
+        # every edge joining two distinct, known nodes
+        node_ids = set(map(_get_id, self.nodes))
+
+        for edge in self.edges:
+            source = edge.source
+            target = edge.target
+
+            if source == target:
+                raise ValueError(f"Self-loop detected on node '{source}'")
+            if source not in node_ids:
+                raise ValueError(f"Unknown source node '{source}'")
+            if target not in node_ids:
+                raise ValueError(f"Unknown target node '{target}'")
+
+        return self
+
+
+# Built once at import so request handling reuses the compiled validator
+PIPELINE_ADAPTER = TypeAdapter(Pipeline)
+
 
 # ===============================
 # PIPELINE RESPONSE
@@ -0,0 +1,146 @@
+# app/services/batcher.py
+
+import asyncio
+import logging
+from typing import Any, Dict, Hashable, List, Optional, Set, Tuple
+from anyio import to_thread
+from app.services.pipeline_analyzer import analyze_batch
+from app.services.pipeline_parser import ParsedPipeline
+
+logger = logging.getLogger(__name__)
+
+
+class AnalysisBatcher:
+    """
+    Coalesces concurrent analysis requests into batches.
+
+    A consumer task drains up to max_batch_size queued requests
+    (waiting at most max_wait seconds for more to arrive) and hands the
+    batch to a worker thread, which analyzes each distinct pipeline
+    once. Up to max_in_flight batches run at the same time; while all
+    of them are busy, new requests queue up into the next batch.
+    Requests submitted with the same key while a batch is being
+    collected share one analysis.
+    """
+
+    def __init__(
+        self,
+        max_batch_size: int = 16,
+        max_wait: float = 0.0,
+        max_in_flight: int = 1,
+    ):
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self._running: Set[asyncio.Task] = set()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._consume())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        tasks = [self._task, *self._running]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._task = None
+
+    async def submit(
+        self,
+        key: Optional[Hashable],
+        pipeline: ParsedPipeline,
+    ) -> Tuple[int, int, bool, Optional[List[str]]]:
+        """
+        Queue a pipeline for analysis and wait for its result.
+
+        key identifies identical pipelines (the cache key); None means
+        the request is never merged with another one.
+        """
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((key, pipeline, future))
+
+        return await future
+
+    async def _collect(self) -> List[Tuple[Any, ParsedPipeline, Any]]:
+        queue = self._queue
+        batch = [await queue.get()]
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            if not queue.empty():
+                batch.append(queue.get_nowait())
+                continue
+
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _consume(self) -> None:
+        while True:
+            await self._slots.acquire()
+            try:
+                batch = await self._collect()
+            except BaseException:
+                self._slots.release()
+                raise
+
+            task = asyncio.create_task(self._run(batch))
+            self._running.add(task)
+            task.add_done_callback(self._finished)
+
+    def _finished(self, task: asyncio.Task) -> None:
+        self._running.discard(task)
+        self._slots.release()
+
+    async def _run(self, batch: List[Tuple[Any, ParsedPipeline, Any]]) -> None:
+        groups: Dict[Hashable, List[asyncio.Future]] = {}
+        jobs: List[Tuple[ParsedPipeline, List[asyncio.Future]]] = []
+
+        for key, pipeline, future in batch:
+            if key is not None and key in groups:
+                groups[key].append(future)
+                continue
+
+            waiters = [future]
+            jobs.append((pipeline, waiters))
+            if key is not None:
+                groups[key] = waiters
+
+        try:
+            outcomes = await to_thread.run_sync(
+                analyze_batch, [pipeline for pipeline, _ in jobs]
+            )
+        except asyncio.CancelledError:
+            for _, waiters in jobs:
+                for future in waiters:
+                    future.cancel()
+            raise
+        except Exception as exc:
+            logger.exception("Batch analysis failed")
+            outcomes = [exc] * len(jobs)
+
+        for (_, waiters), outcome in zip(jobs, outcomes):
+            for future in waiters:
+                # Waiters whose request was cancelled are skipped
+                if future.done():
+                    continue
+                # analyze_batch returns a failing job's exception in
+                # place of its result
+                if isinstance(outcome, Exception):
+                    future.set_exception(outcome)
+                else:
+                    future.set_result(outcome)
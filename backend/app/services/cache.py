@@ -1,59 +1,246 @@
 # app/services/cache.py
 
+import heapq
+import threading
+from array import array
 import time
-from typing import Dict, Any, Optional
+from collections import OrderedDict
+from itertools import count
+from typing import Dict, Any, Hashable, List, Optional, Tuple
 from app.core.config import settings
 
+MAX_ENTRIES = settings.CACHE_MAX_ENTRIES
+NUM_SHARDS = settings.CACHE_SHARDS  # must be a power of two
+STATS_TTL = 1.0  # seconds a computed stats() result is reused
 
-class SimpleCache:
+# Slots in _CacheShard.counters
+HITS, MISSES = 0, 1
+
+# Count-min sketch rows and the per-counter ceiling (4-bit counters)
+SKETCH_DEPTH = 4
+SKETCH_MAX_COUNT = 15
+_SKETCH_SEEDS = (0x9E3779B1, 0x85EBCA77, 0xC2B2AE3D, 0x27D4EB2F)
+
+
+class _FrequencySketch:
     """
-    Simple in-memory cache.
-    Designed to be easily replaced by Redis / Memcached later.
+    Count-min sketch estimating how often each key was seen recently.
+
+    All counters are halved once the number of recorded accesses reaches
+    ten times the sketch width, so old popularity fades out.
     """
 
-    def __init__(self):
-        self._cache: Dict[str, tuple[Any, float]] = {}
-        self.hits: int = 0
-        self.misses: int = 0
+    def __init__(self, max_entries: int):
+        width = 16
+        while width < 4 * max_entries:
+            width <<= 1
+
+        self.mask = width - 1
+        self.table = bytearray(SKETCH_DEPTH * width)
+        self.offsets = [row * width for row in range(SKETCH_DEPTH)]
+        self.additions = 0
+        self.sample_size = 10 * width
+
+    def _slots(self, key_hash: int) -> List[int]:
+        mask = self.mask
+        return [
+            offset + (((key_hash ^ seed) * 0x9E3779B97F4A7C15 >> 32) & mask)
+            for offset, seed in zip(self.offsets, _SKETCH_SEEDS)
+        ]
+
+    def increment(self, key_hash: int) -> None:
+        table = self.table
+        for slot in self._slots(key_hash):
+            if table[slot] < SKETCH_MAX_COUNT:
+                table[slot] += 1
+
+        self.additions += 1
+        if self.additions >= self.sample_size:
+            self.table = bytearray(count >> 1 for count in table)
+            self.additions //= 2
+
+    def estimate(self, key_hash: int) -> int:
+        table = self.table
+        return min(table[slot] for slot in self._slots(key_hash))
+
+
+class _CacheShard:
+    """
+    One LRU + TTL partition of SimpleCache, guarded by its own lock.
+
+    Entries store their absolute expiry time, so a lookup is a single
+    comparison against the current time.
+
+    New keys are admitted TinyLFU-style: when the shard is full, a key
+    only replaces the LRU victim if it has been seen at least as often,
+    so a burst of one-off pipelines cannot flush the hot ones.
+    """
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.entries: OrderedDict[Hashable, tuple[Any, float]] = OrderedDict()
+        # (expires_at, seq, key) min-heap so expired entries are reclaimed
+        # without waiting for them to be accessed
+        self.exp_heap: List[Tuple[float, int, Hashable]] = []
+        # Tie-breaker so keys of different types are never compared
+        self.seq = count()
+        # [hits, misses] packed in one array
+        self.counters = array("q", [0, 0])
+        self.sketch = _FrequencySketch(max_entries)
+
+    def purge_expired(self, now: float) -> None:
+        heap = self.exp_heap
+
+        while heap and heap[0][0] < now:
+            _, _, key = heapq.heappop(heap)
+            entry = self.entries.get(key)
+
+            # Skip keys that were re-set (later expiry) or evicted
+            if entry is not None and entry[1] < now:
+                del self.entries[key]
+
+        # Re-set and evicted keys leave stale heap entries behind;
+        # rebuild from the live entries if they start to dominate
+        if len(heap) > 2 * self.max_entries:
+            self.exp_heap = [
+                (expires_at, next(self.seq), k)
+                for k, (_, expires_at) in self.entries.items()
+            ]
+            heapq.heapify(self.exp_heap)
+
+    def get(self, key: Hashable, now: float) -> Optional[Any]:
+        self.purge_expired(now)
+        self.sketch.increment(hash(key))
 
-    def get(self, key: str) -> Optional[Any]:
-        entry = self._cache.get(key)
+        entry = self.entries.get(key)
         if not entry:
-            self.misses += 1
+            self.counters[MISSES] += 1
             return None
 
-        value, timestamp = entry
-        if time.time() - timestamp > settings.CACHE_TTL:
-            del self._cache[key]
-            self.misses += 1
+        value, expires_at = entry
+        if expires_at < now:
+            del self.entries[key]
+            self.counters[MISSES] += 1
             return None
 
-        self.hits += 1
+        self.entries.move_to_end(key)
+        self.counters[HITS] += 1
         return value
 
-    def set(self, key: str, value: Any) -> None:
-        # Basic eviction strategy
-        if len(self._cache) > 1_000:
-            oldest_keys = sorted(
-                self._cache.items(),
-                key=lambda item: item[1][1]
-            )[:200]
+    def set(self, key: Hashable, value: Any, now: float) -> None:
+        self.purge_expired(now)
 
-            for k, _ in oldest_keys:
-                del self._cache[k]
+        sketch = self.sketch
+        key_hash = hash(key)
+        sketch.increment(key_hash)
 
-        self._cache[key] = (value, time.time())
+        if key in self.entries:
+            self.entries.move_to_end(key)
+        elif len(self.entries) >= self.max_entries:
+            victim = next(iter(self.entries))
+            if sketch.estimate(key_hash) < sketch.estimate(hash(victim)):
+                return
+
+            # Evict least recently used entries, O(1) each
+            while len(self.entries) >= self.max_entries:
+                self.entries.popitem(last=False)
+
+        expires_at = now + self.ttl
+        self.entries[key] = (value, expires_at)
+        heapq.heappush(self.exp_heap, (expires_at, next(self.seq), key))
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.exp_heap.clear()
+        self.sketch = _FrequencySketch(self.max_entries)
+
+
+class SimpleCache:
+    """
+    Simple in-memory LRU cache with TTL and TinyLFU admission.
+    Designed to be easily replaced by Redis / Memcached later.
+
+    Keys are spread over independently locked shards, so concurrent
+    requests only contend when they land on the same shard.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        ttl: Optional[float] = None,
+        num_shards: int = NUM_SHARDS,
+    ):
+        if max_entries is None:
+            max_entries = MAX_ENTRIES
+        if ttl is None:
+            ttl = settings.CACHE_TTL
+        if num_shards < 1 or num_shards & (num_shards - 1):
+            raise ValueError("num_shards must be a power of two")
+
+        shard_entries = max(1, max_entries // num_shards)
+        self._shards = [
+            _CacheShard(shard_entries, ttl) for _ in range(num_shards)
+        ]
+        self._mask = num_shards - 1
+        self._stats: Optional[Dict[str, Any]] = None
+        self._stats_at: float = 0.0
+
+    def _shard(self, key: Hashable) -> _CacheShard:
+        return self._shards[hash(key) & self._mask]
+
+    @property
+    def hits(self) -> int:
+        return sum(shard.counters[HITS] for shard in self._shards)
+
+    @property
+    def misses(self) -> int:
+        return sum(shard.counters[MISSES] for shard in self._shards)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        shard = self._shard(key)
+        with shard.lock:
+            return shard.get(key, time.time())
+
+    def set(self, key: Hashable, value: Any) -> None:
+        shard = self._shard(key)
+        with shard.lock:
+            shard.set(key, value, time.time())
 
     def clear(self) -> None:
-        self._cache.clear()
+        for shard in self._shards:
+            with shard.lock:
+                shard.clear()
+        self._stats = None
 
     def stats(self) -> Dict[str, Any]:
-        total = self.hits + self.misses
-        hit_rate = (self.hits / total * 100) if total else 0.0
+        # Summing every shard is only worth doing once per STATS_TTL
+        now = time.monotonic()
+        if self._stats is not None and now - self._stats_at < STATS_TTL:
+            return self._stats
+
+        hits = self.hits
+        misses = self.misses
+        total = hits + misses
+        hit_rate = (hits / total * 100) if total else 0.0
 
-        return {
-            "size": len(self._cache),
-            "hits": self.hits,
-            "misses": self.misses,
+        self._stats = {
+            "size": sum(len(shard.entries) for shard in self._shards),
+            "hits": hits,
+            "misses": misses,
             "hit_rate": f"{hit_rate:.2f}%",
         }
+        self._stats_at = now
+        return self._stats
+
+
+# Process-wide instance shared by the pipeline and metrics routes
+cache = SimpleCache()
+
+# Validation errors of recently rejected request bodies, kept apart so
+# they neither evict analysis results nor skew the reported hit rate
+rejections = SimpleCache(
+    max_entries=settings.CACHE_NEGATIVE_MAX_ENTRIES,
+    ttl=settings.CACHE_NEGATIVE_TTL,
+)
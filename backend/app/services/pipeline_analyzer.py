@@ -1,63 +1,93 @@
 # app/services/pipeline_analyzer.py
 
-from typing import Optional, List, Tuple
-import networkx as nx
-from fastapi import HTTPException
+from itertools import repeat
+from typing import Optional, List, Sequence, Tuple, Union
+import numpy as np
 from app.models.pipeline import Pipeline
+from app.services._cycle_numba import build_csr, find_cycle_csr
+from app.services.pipeline_parser import ParsedPipeline
 
 
-def analyze_pipeline(
-    pipeline: Pipeline
+def analyze_graph(
+    node_ids: Sequence[str],
+    sources: Sequence[str],
+    targets: Sequence[str],
 ) -> Tuple[int, int, bool, Optional[List[str]]]:
     """
-    Analyze pipeline graph structure.
+    Analyze a pipeline graph given as node ids plus parallel edge
+    source / target id lists.
+
+    Edge references are validated with the request (Pipeline model or
+    the raw-JSON parser), so no per-edge checks are done here.
 
     Returns:
         (num_nodes, num_edges, is_dag, cycle_path)
     """
 
-    num_nodes = len(pipeline.nodes)
-    num_edges = len(pipeline.edges)
+    num_nodes = len(node_ids)
+    num_edges = len(sources)
 
     if num_nodes == 0:
         return 0, 0, True, None
 
-    node_ids = {node.id for node in pipeline.nodes}
-
-    graph = nx.MultiDiGraph()
-    graph.add_nodes_from(node_ids)
-
-    for edge in pipeline.edges:
-        if edge.source == edge.target:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Self-loop detected on node '{edge.source}'"
-            )
-
-        if edge.source not in node_ids:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Unknown source node '{edge.source}'"
-            )
-
-        if edge.target not in node_ids:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Unknown target node '{edge.target}'"
-            )
-
-        graph.add_edge(
-            edge.source,
-            edge.target,
-            sourceHandle=edge.sourceHandle,
-            targetHandle=edge.targetHandle,
-        )
-
-    try:
-        cycle_edges = nx.find_cycle(graph, orientation="original")
-        cycle = [edge[0] for edge in cycle_edges]
-        cycle.append(cycle_edges[0][0])
-        return num_nodes, num_edges, False, cycle
-
-    except nx.NetworkXNoCycle:
+    id_to_idx = {nid: i for i, nid in enumerate(node_ids)}
+    get_idx = id_to_idx.get
+    missing = repeat(-1)
+
+    # Ids are resolved with C-level map() calls; unknown ids map to -1
+    src_idx = np.fromiter(
+        map(get_idx, sources, missing), dtype=np.int32, count=num_edges
+    )
+    dst_idx = np.fromiter(
+        map(get_idx, targets, missing), dtype=np.int32, count=num_edges
+    )
+
+    # The kernels do no bounds checks, so guard against unvalidated
+    # input rather than letting -1 index into the CSR arrays; self-loops
+    # are refused here too, as the Pipeline model does
+    if num_edges:
+        if min(src_idx.min(), dst_idx.min()) < 0:
+            raise ValueError("Edge references an unknown node")
+        if (src_idx == dst_idx).any():
+            raise ValueError("Self-loop detected")
+
+    indptr, indices = build_csr(src_idx, dst_idx, np.int32(num_nodes))
+    cycle = find_cycle_csr(indptr, indices, np.int32(num_nodes))
+
+    if cycle.size == 0:
         return num_nodes, num_edges, True, None
+
+    return num_nodes, num_edges, False, [node_ids[i] for i in cycle.tolist()]
+
+
+def analyze_pipeline(
+    pipeline: Pipeline
+) -> Tuple[int, int, bool, Optional[List[str]]]:
+    """
+    Analyze pipeline graph structure.
+
+    Returns:
+        (num_nodes, num_edges, is_dag, cycle_path)
+    """
+
+    return analyze_graph(*ParsedPipeline.from_model(pipeline))
+
+
+def analyze_batch(
+    pipelines: Sequence[Tuple[Sequence[str], Sequence[str], Sequence[str]]],
+) -> List[Union[Tuple[int, int, bool, Optional[List[str]]], Exception]]:
+    """
+    Analyze several (node_ids, sources, targets) graphs in one call.
+
+    Each entry is the analysis result or the exception raised for that
+    graph, so one bad pipeline does not fail the rest of the batch.
+    """
+
+    outcomes = []
+    for pipeline in pipelines:
+        try:
+            outcomes.append(analyze_graph(*pipeline))
+        except Exception as exc:
+            outcomes.append(exc)
+
+    return outcomes
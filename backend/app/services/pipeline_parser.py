@@ -0,0 +1,232 @@
+# app/services/pipeline_parser.py
+
+import json
+from operator import attrgetter
+from typing import Any, List, NamedTuple
+import orjson
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
+from app.core.config import settings
+from app.models.pipeline import PIPELINE_ADAPTER, Pipeline
+
+
+_get_id = attrgetter("id")
+_get_source = attrgetter("source")
+_get_target = attrgetter("target")
+
+
+class ParsedPipeline(NamedTuple):
+    """
+    Column-oriented view of a validated pipeline request.
+
+    Holds only the fields the analyzer and cache key need, so the hot
+    path never allocates Node / Edge / Pipeline models.
+    """
+
+    node_ids: List[str]
+    sources: List[str]
+    targets: List[str]
+
+    @classmethod
+    def from_model(cls, pipeline: Pipeline) -> "ParsedPipeline":
+        """
+        Extract the id columns from a Pipeline model in one pass per
+        column, with C-level attribute getters.
+        """
+
+        edges = pipeline.edges
+        return cls(
+            list(map(_get_id, pipeline.nodes)),
+            list(map(_get_source, edges)),
+            list(map(_get_target, edges)),
+        )
+
+
+class _Invalid(Exception):
+    """Raised by the fast path when the document needs full validation."""
+
+
+def _is_text(value: Any) -> bool:
+    return type(value) is str and bool(value) and not value.isspace()
+
+
+def _is_handle(value: Any) -> bool:
+    return value is None or type(value) is str
+
+
+def _decode(raw: bytes) -> Any:
+    if not raw:
+        raise RequestValidationError(
+            [
+                {
+                    "type": "missing",
+                    "loc": ("body",),
+                    "msg": "Field required",
+                    "input": None,
+                }
+            ]
+        )
+
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        pass
+
+    # orjson is stricter than json (e.g. NaN); fall back to json so the
+    # accepted input and error messages match FastAPI's own body parsing
+    try:
+        return json.loads(raw)
+    except json.JSONDecodeError as exc:
+        raise RequestValidationError(
+            [
+                {
+                    "type": "json_invalid",
+                    "loc": ("body", exc.pos),
+                    "msg": "JSON decode error",
+                    "input": {},
+                    "ctx": {"error": exc.msg},
+                }
+            ],
+            body=exc.doc,
+        ) from exc
+
+
+def _edge_error(
+    index: int,
+    field: str,
+    value: str,
+    message: str,
+) -> RequestValidationError:
+    """
+    422 for a single bad edge reference, located at the offending field
+    and carrying only that field's value as input.
+    """
+
+    return RequestValidationError(
+        [
+            {
+                "type": "value_error",
+                "loc": ("body", "edges", index, field),
+                "msg": f"Value error, {message}",
+                "input": value,
+            }
+        ]
+    )
+
+
+def _parse_fast(doc: Any) -> ParsedPipeline:
+    if type(doc) is not dict:
+        raise _Invalid
+
+    nodes = doc.get("nodes")
+    edges = doc.get("edges")
+
+    if type(nodes) is not list or type(edges) is not list:
+        raise _Invalid
+    if len(nodes) > settings.MAX_NODES or len(edges) > settings.MAX_EDGES:
+        raise _Invalid
+
+    max_id_length = settings.MAX_NODE_ID_LENGTH
+    node_ids: List[str] = []
+    seen = set()
+
+    for node in nodes:
+        if type(node) is not dict:
+            raise _Invalid
+
+        node_id = node.get("id")
+        node_type = node.get("type")
+
+        if not _is_text(node_id) or len(node_id) > max_id_length:
+            raise _Invalid
+        if not _is_text(node_type):
+            raise _Invalid
+        if type(node.get("data", {})) is not dict:
+            raise _Invalid
+        # Duplicates are reported by the model, stop at the first one
+        if node_id in seen:
+            raise _Invalid
+
+        seen.add(node_id)
+        node_ids.append(node_id)
+
+    sources: List[str] = []
+    targets: List[str] = []
+
+    for index, edge in enumerate(edges):
+        if type(edge) is not dict:
+            raise _Invalid
+
+        source = edge.get("source")
+        target = edge.get("target")
+        source_handle = edge.get("sourceHandle")
+        target_handle = edge.get("targetHandle")
+
+        if not _is_text(source) or not _is_text(target):
+            raise _Invalid
+        if not _is_handle(source_handle) or not _is_handle(target_handle):
+            raise _Invalid
+        # Reported here rather than by the model, whose error would echo
+        # the whole request body back as its input
+        if source == target:
+            raise _edge_error(
+                index, "target", target,
+                f"Self-loop detected on node '{source}'",
+            )
+        if source not in seen:
+            raise _edge_error(
+                index, "source", source,
+                f"Unknown source node '{source}'",
+            )
+        if target not in seen:
+            raise _edge_error(
+                index, "target", target,
+                f"Unknown target node '{target}'",
+            )
+
+        sources.append(source)
+        targets.append(target)
+
+    return ParsedPipeline(node_ids, sources, targets)
+
+
+def _parse_model(doc: Any) -> ParsedPipeline:
+    """
+    Slow path: validate through the Pydantic model so errors carry the
+    same locations and messages as a regular FastAPI body.
+
+    Uses validate_python on the already-decoded document (with
+    from_attributes, as FastAPI does) rather than validate_json, so the
+    body is not decoded twice and error types match FastAPI's.
+    """
+
+    try:
+        pipeline = PIPELINE_ADAPTER.validate_python(doc, from_attributes=True)
+    except ValidationError as exc:
+        raise RequestValidationError(
+            [
+                {**error, "loc": ("body", *error["loc"])}
+                for error in exc.errors(include_url=False)
+            ],
+            body=doc,
+        ) from exc
+
+    return ParsedPipeline.from_model(pipeline)
+
+
+def parse_pipeline_json(raw: bytes) -> ParsedPipeline:
+    """
+    Parse and validate a raw pipeline request body.
+
+    Well-formed documents are checked in a single pass over the decoded
+    JSON; self-loops and unknown edge references are reported from that
+    pass directly. Anything else the fast path rejects is re-validated
+    through the Pipeline model. Both raise RequestValidationError (422).
+    """
+
+    doc = _decode(raw)
+
+    try:
+        return _parse_fast(doc)
+    except _Invalid:
+        return _parse_model(doc)
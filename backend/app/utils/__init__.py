@@ -1,3 +1,3 @@
 # app/utils/__init__.py
 
-from .hashing import generate_cache_key
+from .hashing import parsed_cache_key
@@ -1,28 +1,102 @@
 # app/utils/hashing.py
 
-import hashlib
-from app.models.pipeline import Pipeline
+import struct
+from typing import Hashable, List, Tuple
+import xxhash
+from app.core.config import settings
+from app.services.pipeline_parser import ParsedPipeline
 
+# Ids are arbitrary user strings (separator bytes included), so every
+# field and section is length-prefixed to keep the byte stream unambiguous
+_pack_length = struct.Struct("<I").pack
 
-def generate_cache_key(pipeline: Pipeline) -> str:
+
+def _field(value: str) -> bytes:
+    encoded = value.encode()
+    return _pack_length(len(encoded)) + encoded
+
+
+def _hash_records(node_records: List[bytes], edge_records: List[bytes]) -> str:
+    """
+    Hash two lists of encoded records in canonical (sorted) order.
+
+    Records are built from length-prefixed fields and each list is
+    preceded by its record count, so distinct pipelines never produce
+    the same byte stream.
+    """
+
+    hasher = xxhash.xxh3_128()
+
+    node_records.sort()
+    hasher.update(_pack_length(len(node_records)))
+    for record in node_records:
+        hasher.update(record)
+
+    edge_records.sort()
+    hasher.update(_pack_length(len(edge_records)))
+    for record in edge_records:
+        hasher.update(record)
+
+    return hasher.hexdigest()
+
+
+def generate_parsed_cache_key(parsed: ParsedPipeline) -> str:
     """
-    Generate a deterministic hash for a pipeline definition.
+    Generate a deterministic hash for a parsed pipeline.
     Ensures identical pipelines always produce the same cache key,
     regardless of node or edge ordering.
+
+    Uses XXH3-128: cache keys are not security-sensitive, so a fast
+    non-cryptographic hash is sufficient. Records are streamed into the
+    hasher one by one instead of being joined into a single string.
+
+    Only the graph structure is hashed (node ids and edge endpoints):
+    node types, node data and edge handles do not affect the analysis
+    result, so pipelines differing only in those share a cache entry.
     """
 
-    nodes_str = "|".join(
-        sorted(f"{node.id}:{node.type}" for node in pipeline.nodes)
+    return _hash_records(
+        list(map(_field, parsed.node_ids)),
+        [
+            _field(source) + _field(target)
+            for source, target in zip(parsed.sources, parsed.targets)
+        ],
     )
 
-    edges_str = "|".join(
-        sorted(
-            f"{edge.source}:{edge.sourceHandle}"
-            f"->{edge.target}:{edge.targetHandle}"
-            for edge in pipeline.edges
-        )
+
+def direct_cache_key(
+    parsed: ParsedPipeline,
+) -> Tuple[Tuple[str, ...], Tuple[Tuple[str, str], ...]]:
+    """
+    Order-independent cache key for small pipelines, used as-is.
+
+    Sorting a few dozen ids and letting the cache dict hash the tuples
+    is cheaper than building and digesting the canonical records.
+    """
+
+    return (
+        tuple(sorted(parsed.node_ids)),
+        tuple(sorted(zip(parsed.sources, parsed.targets))),
     )
 
-    cache_input = f"{nodes_str}::{edges_str}"
 
-    return hashlib.sha256(cache_input.encode("utf-8")).hexdigest()
+def parsed_cache_key(parsed: ParsedPipeline) -> Hashable:
+    """
+    Cache key for a parsed pipeline: the direct tuple key below
+    CACHE_DIRECT_KEY_MAX_SIZE nodes + edges, the XXH3 digest otherwise.
+    """
+
+    payload_size = len(parsed.node_ids) + len(parsed.sources)
+    if payload_size < settings.CACHE_DIRECT_KEY_MAX_SIZE:
+        return direct_cache_key(parsed)
+
+    return generate_parsed_cache_key(parsed)
+
+
+def body_cache_key(raw: bytes) -> bytes:
+    """
+    Cache key for a raw request body: its XXH3-128 digest, used to
+    remember rejected bodies before they are parsed.
+    """
+
+    return xxhash.xxh3_128_digest(raw)
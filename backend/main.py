@@ -3,8 +3,11 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.core.config import settings
+from app.core.exception_handlers import http_exception_handler
 from app.core.lifespan import lifespan
 from app.core.logging import setup_logging
 from app.core.rate_limiter import (
@@ -14,6 +17,7 @@ from app.core.rate_limiter import (
 )
 
 from app.middleware.logging import RequestLoggingMiddleware
+from app.middleware.remote_address import RemoteAddressMiddleware
 from app.api.routes.health import router as health_router
 from app.api.routes.metrics import router as metrics_router
 from app.api.routes.pipelines import router as pipelines_router
@@ -36,9 +40,16 @@ app = FastAPI(
     docs_url="/api/docs",
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json",
+    default_response_class=ORJSONResponse,
 )
 
 
+# ===============================
+# ERROR HANDLING
+# ===============================
+app.add_exception_handler(StarletteHTTPException, http_exception_handler)
+
+
 # ===============================
 # RATE LIMITING
 # ===============================
@@ -61,8 +72,14 @@ app.add_middleware(
     max_age=3600,
 )
 
-app.add_middleware(GZipMiddleware, minimum_size=500)
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=settings.GZIP_MINIMUM_SIZE,
+    compresslevel=settings.GZIP_COMPRESS_LEVEL,
+)
 app.add_middleware(RequestLoggingMiddleware)
+# Added last so it runs first and the address is set for everything below
+app.add_middleware(RemoteAddressMiddleware)
 
 
 # ===============================
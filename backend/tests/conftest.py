@@ -7,4 +7,7 @@ from backend.main import app
 
 @pytest.fixture(scope="session")
 def client():
-    return TestClient(app)
+    # Entered as a context manager so the lifespan (batcher, kernel
+    # warm-up) runs as it does in production
+    with TestClient(app) as test_client:
+        yield test_client
@@ -0,0 +1,107 @@
+# tests/test_batcher.py
+
+import asyncio
+import threading
+import pytest
+from app.services import batcher as batcher_module
+from app.services.batcher import AnalysisBatcher
+from app.services.pipeline_parser import ParsedPipeline
+
+
+@pytest.fixture
+def batch_calls(monkeypatch):
+    """
+    Record the size of every batch handed to analyze_batch.
+    """
+
+    calls = []
+    analyze_batch = batcher_module.analyze_batch
+
+    def recording_batch(pipelines):
+        calls.append(len(pipelines))
+        return analyze_batch(pipelines)
+
+    monkeypatch.setattr(batcher_module, "analyze_batch", recording_batch)
+    return calls
+
+
+def test_batcher_coalesces_identical_requests(batch_calls):
+    async def scenario():
+        batcher = AnalysisBatcher(max_batch_size=16, max_wait=0.01)
+        batcher.start()
+
+        cyclic = ParsedPipeline(["a", "b"], ["a", "b"], ["b", "a"])
+        plain = ParsedPipeline(["x", "y"], ["x"], ["y"])
+
+        results = await asyncio.gather(
+            batcher.submit("cyclic", cyclic),
+            batcher.submit("cyclic", cyclic),
+            batcher.submit(None, plain),
+        )
+        await batcher.stop()
+        return results
+
+    first, second, third = asyncio.run(scenario())
+
+    assert batch_calls == [2]
+    assert first == second
+    assert first[2] is False
+    assert third == (2, 1, True, None)
+
+
+def test_batcher_isolates_analysis_errors():
+    async def scenario():
+        batcher = AnalysisBatcher(max_wait=0.01)
+        batcher.start()
+        try:
+            return await asyncio.gather(
+                batcher.submit(None, ParsedPipeline(["a"], ["a"], ["b"])),
+                batcher.submit(None, ParsedPipeline(["x", "y"], ["x"], ["y"])),
+                return_exceptions=True,
+            )
+        finally:
+            await batcher.stop()
+
+    failed, analyzed = asyncio.run(scenario())
+
+    assert isinstance(failed, ValueError)
+    assert analyzed == (2, 1, True, None)
+
+
+def test_batcher_runs_batches_concurrently(monkeypatch):
+    # Each single-request batch blocks until the other one has started
+    barrier = threading.Barrier(2, timeout=5)
+    analyze_batch = batcher_module.analyze_batch
+
+    def blocking_batch(pipelines):
+        barrier.wait()
+        return analyze_batch(pipelines)
+
+    monkeypatch.setattr(batcher_module, "analyze_batch", blocking_batch)
+
+    async def scenario():
+        batcher = AnalysisBatcher(max_batch_size=1, max_in_flight=2)
+        batcher.start()
+        try:
+            return await asyncio.gather(
+                batcher.submit(None, ParsedPipeline(["a"], [], [])),
+                batcher.submit(None, ParsedPipeline(["b"], [], [])),
+            )
+        finally:
+            await batcher.stop()
+
+    assert asyncio.run(scenario()) == [(1, 0, True, None)] * 2
+
+
+def test_parse_route_uses_lifespan_batcher(client, batch_calls):
+    payload = {
+        "nodes": [{"id": "p", "type": "node"}, {"id": "q", "type": "node"}],
+        "edges": [{"source": "p", "target": "q"}],
+    }
+
+    assert isinstance(client.app.state.batcher, AnalysisBatcher)
+    response = client.post("/pipelines/parse", json=payload)
+
+    assert response.status_code == 200
+    assert response.json()["is_dag"] is True
+    assert batch_calls == [1]
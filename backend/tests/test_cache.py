@@ -0,0 +1,99 @@
+# tests/test_cache.py
+
+import threading
+import pytest
+from app.services import cache as cache_module
+from app.services.cache import SimpleCache
+
+
+def test_cache_get_set():
+    cache = SimpleCache()
+
+    assert cache.get("missing") is None
+    cache.set("key", 42)
+    assert cache.get("key") == 42
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
+def test_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(cache_module, "MAX_ENTRIES", 2)
+    cache = SimpleCache(num_shards=1)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_cache_keeps_frequent_keys_during_scan(monkeypatch):
+    monkeypatch.setattr(cache_module, "MAX_ENTRIES", 4)
+    cache = SimpleCache(num_shards=1)
+
+    cache.set("hot", 0)
+    for _ in range(5):
+        cache.get("hot")
+
+    for i in range(20):
+        cache.set(f"scan-{i}", i)
+
+    assert cache.get("hot") == 0
+
+
+def test_cache_purges_expired_entries(monkeypatch):
+    now = [1_000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+    monkeypatch.setattr(cache_module.settings, "CACHE_TTL", 10)
+    cache = SimpleCache(num_shards=1)
+
+    cache.set("old", 1)
+    now[0] += 11
+    cache.set("new", 2)
+
+    assert cache.stats()["size"] == 1
+    assert cache.get("new") == 2
+
+
+def test_cache_entry_expires_after_ttl(monkeypatch):
+    now = [1_000.0]
+    monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+    cache = SimpleCache(max_entries=4, ttl=5, num_shards=1)
+
+    cache.set("key", 1)
+    now[0] += 5
+    assert cache.get("key") == 1
+
+    now[0] += 1
+    assert cache.get("key") is None
+
+
+def test_cache_requires_power_of_two_shards():
+    with pytest.raises(ValueError):
+        SimpleCache(num_shards=12)
+
+
+def test_cache_counters_under_concurrency():
+    cache = SimpleCache()
+
+    def worker(prefix: str):
+        for i in range(500):
+            cache.set(f"{prefix}-{i}", i)
+            cache.get(f"{prefix}-{i}")
+
+    threads = [
+        threading.Thread(target=worker, args=(str(n),)) for n in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = cache.stats()
+    assert stats["hits"] + stats["misses"] == 8 * 500
+    assert stats["size"] <= cache_module.MAX_ENTRIES
@@ -0,0 +1,81 @@
+# tests/test_hashing.py
+
+from app.models.pipeline import Pipeline, Node, Edge
+from app.services.pipeline_parser import parse_pipeline_json
+from app.services.pipeline_parser import ParsedPipeline
+from app.utils.hashing import (
+    direct_cache_key,
+    generate_parsed_cache_key,
+    parsed_cache_key,
+)
+
+
+def model_key(pipeline: Pipeline) -> str:
+    return generate_parsed_cache_key(ParsedPipeline.from_model(pipeline))
+
+
+def test_cache_key_ignores_ordering():
+    first = Pipeline(
+        nodes=[Node(id="a", type="input"), Node(id="b", type="output")],
+        edges=[Edge(source="a", target="b")],
+    )
+    second = Pipeline(
+        nodes=[Node(id="b", type="output"), Node(id="a", type="input")],
+        edges=[Edge(source="a", target="b")],
+    )
+
+    assert model_key(first) == model_key(second)
+
+
+def test_cache_key_differs_for_different_edges():
+    nodes = [Node(id="a", type="node"), Node(id="b", type="node")]
+
+    forward = Pipeline(nodes=nodes, edges=[Edge(source="a", target="b")])
+    backward = Pipeline(nodes=nodes, edges=[Edge(source="b", target="a")])
+
+    assert model_key(forward) != model_key(backward)
+
+
+def test_parsed_cache_key_matches_model_key():
+    pipeline = Pipeline(
+        nodes=[Node(id="a", type="input"), Node(id="b", type="output")],
+        edges=[Edge(source="a", target="b", sourceHandle="a-out")],
+    )
+    parsed = parse_pipeline_json(pipeline.model_dump_json().encode())
+
+    assert generate_parsed_cache_key(parsed) == model_key(pipeline)
+
+
+def test_cache_key_ignores_node_types():
+    edges = [Edge(source="a", target="b")]
+
+    first = Pipeline(
+        nodes=[Node(id="a", type="input"), Node(id="b", type="output")],
+        edges=edges,
+    )
+    second = Pipeline(
+        nodes=[Node(id="a", type="llm"), Node(id="b", type="text")],
+        edges=edges,
+    )
+
+    assert model_key(first) == model_key(second)
+
+
+def test_small_pipelines_use_direct_key():
+    first = ParsedPipeline(["a", "b"], ["a"], ["b"])
+    second = ParsedPipeline(["b", "a"], ["a"], ["b"])
+
+    assert parsed_cache_key(first) == direct_cache_key(second)
+
+    node_ids = [f"n{i}" for i in range(64)]
+    large = ParsedPipeline(node_ids, [], [])
+    assert parsed_cache_key(large) == generate_parsed_cache_key(large)
+
+
+def test_cache_key_is_unambiguous_for_separator_bytes():
+    filler = [f"f{i}" for i in range(63)]
+
+    joined = ParsedPipeline(["a\x1eb", *filler], [], [])
+    split = ParsedPipeline(["a", "b", *filler], [], [])
+
+    assert generate_parsed_cache_key(joined) != generate_parsed_cache_key(split)
@@ -1,5 +1,8 @@
 # tests/test_health.py
 
+from app.api.routes import health
+
+
 def test_root_endpoint(client):
     response = client.get("/")
     assert response.status_code == 200
@@ -16,3 +19,12 @@ def test_health_endpoint(client):
     data = response.json()
     assert data["status"] == "healthy"
     assert "timestamp" in data
+
+
+def test_health_body_reused_within_second(monkeypatch):
+    monkeypatch.setattr(health.time, "time", lambda: 1_700_000_000.2)
+    first = health.health_body()
+    monkeypatch.setattr(health.time, "time", lambda: 1_700_000_000.9)
+
+    assert health.health_body() is first
+    assert b'"timestamp":"2023-11-14T22:13:20"' in first
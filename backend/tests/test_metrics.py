@@ -10,3 +10,9 @@ def test_metrics_endpoint(client):
 
     assert "max_nodes" in data["config"]
     assert "cache_enabled" in data["config"]
+
+
+def test_metrics_share_pipeline_cache():
+    from app.api.routes import metrics, pipelines
+
+    assert metrics.cache is pipelines.cache
@@ -1,7 +1,11 @@
 # tests/test_pipeline_analyzer.py
 
+import numpy as np
+import pytest
+from pydantic import ValidationError
 from app.models.pipeline import Pipeline, Node, Edge
-from app.services.pipeline_analyzer import analyze_pipeline
+from app.services._cycle_numba import build_csr, find_cycle_csr
+from app.services.pipeline_analyzer import analyze_graph, analyze_pipeline
 
 
 def test_empty_pipeline():
@@ -50,3 +54,79 @@ def test_cycle_detection():
     assert is_dag is False
     assert cycle is not None
     assert cycle[0] == cycle[-1]
+
+
+def test_pipeline_rejects_invalid_edges():
+    nodes = [Node(id="a", type="node"), Node(id="b", type="node")]
+
+    with pytest.raises(ValidationError, match="Unknown source node 'ghost'"):
+        Pipeline(
+            nodes=nodes,
+            edges=[
+                Edge(source="a", target="b"),
+                Edge(source="ghost", target="a"),
+                Edge(source="b", target="b"),
+            ],
+        )
+
+    with pytest.raises(ValidationError, match="Self-loop detected"):
+        Pipeline(nodes=nodes, edges=[Edge(source="b", target="b")])
+
+
+def test_unvalidated_unknown_reference_is_refused():
+    with pytest.raises(ValueError, match="unknown node"):
+        analyze_graph(["a"], ["a"], ["missing"])
+
+
+def test_unvalidated_self_loop_is_refused():
+    with pytest.raises(ValueError, match="Self-loop detected"):
+        analyze_graph(["a", "b"], ["a"], ["a"])
+
+
+def test_cycle_path_follows_edges():
+    pipeline = Pipeline(
+        nodes=[Node(id=nid, type="node") for nid in "abcd"],
+        edges=[
+            Edge(source="a", target="b"),
+            Edge(source="b", target="c"),
+            Edge(source="c", target="d"),
+            Edge(source="d", target="b"),
+        ],
+    )
+
+    n, e, is_dag, cycle = analyze_pipeline(pipeline)
+
+    assert is_dag is False
+    assert cycle == ["b", "c", "d", "b"]
+
+
+def test_long_chain_is_dag():
+    node_ids = [f"n{i}" for i in range(5_000)]
+
+    n, e, is_dag, cycle = analyze_graph(node_ids, node_ids[:-1], node_ids[1:])
+
+    assert n == 5_000
+    assert e == 4_999
+    assert is_dag is True
+    assert cycle is None
+
+
+def test_cycle_reported_from_smallest_component():
+    node_ids = ["a", "b", "c", "d", "x", "y"]
+    sources = ["a", "b", "c", "d", "x", "y"]
+    targets = ["b", "c", "d", "a", "y", "x"]
+
+    n, e, is_dag, cycle = analyze_graph(node_ids, sources, targets)
+
+    assert is_dag is False
+    assert cycle == ["x", "y", "x"]
+
+
+def test_self_loop_only_cycle_is_found():
+    sources = np.array([0, 1], dtype=np.int32)
+    targets = np.array([1, 1], dtype=np.int32)
+
+    indptr, indices = build_csr(sources, targets, np.int32(2))
+    cycle = find_cycle_csr(indptr, indices, np.int32(2))
+
+    assert cycle.tolist() == [1, 1]
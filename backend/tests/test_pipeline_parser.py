@@ -0,0 +1,39 @@
+# tests/test_pipeline_parser.py
+
+import pytest
+from fastapi.exceptions import RequestValidationError
+from app.services.pipeline_parser import parse_pipeline_json
+
+
+def test_parse_valid_body():
+    raw = (
+        b'{"nodes": [{"id": "a", "type": "input", "position": {"x": 0}},'
+        b' {"id": "b", "type": "output"}],'
+        b' "edges": [{"id": "e1", "source": "a", "target": "b",'
+        b' "sourceHandle": "a-out", "targetHandle": null}]}'
+    )
+
+    parsed = parse_pipeline_json(raw)
+
+    assert parsed.node_ids == ["a", "b"]
+    assert parsed.sources == ["a"]
+    assert parsed.targets == ["b"]
+
+
+def test_parse_invalid_body_reports_model_errors():
+    raw = b'{"nodes": [{"id": "a", "type": "x"}, {"id": "a", "type": "x"}],'
+    raw += b' "edges": []}'
+
+    with pytest.raises(RequestValidationError) as exc_info:
+        parse_pipeline_json(raw)
+
+    error = exc_info.value.errors()[0]
+    assert error["loc"] == ("body", "nodes")
+    assert "Duplicate node IDs" in error["msg"]
+
+
+def test_parse_malformed_json():
+    with pytest.raises(RequestValidationError) as exc_info:
+        parse_pipeline_json(b'{"nodes": [')
+
+    assert exc_info.value.errors()[0]["type"] == "json_invalid"
@@ -1,5 +1,8 @@
 # tests/test_pipelines_api.py
 
+from app.services.cache import rejections
+
+
 def test_parse_pipeline_dag(client):
     payload = {
         "nodes": [
@@ -39,3 +42,105 @@ def test_parse_pipeline_cycle(client):
     data = response.json()
     assert data["is_dag"] is False
     assert data["cycle"] is not None
+
+
+def test_parse_pipeline_cache(client):
+    node_ids = [f"n{i}" for i in range(16)]
+    payload = {
+        "nodes": [{"id": nid, "type": "node"} for nid in node_ids],
+        "edges": [
+            {"source": src, "target": dst}
+            for src, dst in zip(node_ids, node_ids[1:])
+        ],
+    }
+
+    first = client.post("/pipelines/parse", json=payload)
+    second = client.post("/pipelines/parse", json=payload)
+
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert second.json()["cache_hit"] is True
+    assert second.json()["num_edges"] == 15
+
+
+def test_parse_large_pipeline(client):
+    node_ids = [f"big{i}" for i in range(5_000)]
+    payload = {
+        "nodes": [{"id": nid, "type": "node"} for nid in node_ids],
+        "edges": [
+            {"source": src, "target": dst}
+            for src, dst in zip(node_ids, node_ids[1:])
+        ],
+    }
+
+    response = client.post("/pipelines/parse", json=payload)
+    assert response.status_code == 200
+
+    data = response.json()
+    assert data["num_nodes"] == 5_000
+    assert data["is_dag"] is True
+
+
+def test_parse_small_pipeline_skips_cache(client):
+    payload = {
+        "nodes": [{"id": "solo", "type": "input"}],
+        "edges": [],
+    }
+
+    client.post("/pipelines/parse", json=payload)
+    response = client.post("/pipelines/parse", json=payload)
+
+    assert response.status_code == 200
+    assert response.json()["cache_hit"] is False
+
+
+def test_parse_pipeline_rejects_blank_node_id(client):
+    payload = {
+        "nodes": [{"id": "   ", "type": "input"}],
+        "edges": [],
+    }
+
+    response = client.post("/pipelines/parse", json=payload)
+    assert response.status_code == 422
+
+
+def test_parse_pipeline_rejects_unknown_reference(client):
+    node_ids = [f"r{i}" for i in range(16)]
+    payload = {
+        "nodes": [{"id": nid, "type": "node"} for nid in node_ids],
+        "edges": [{"source": "r0", "target": "missing"}],
+    }
+
+    response = client.post("/pipelines/parse", json=payload)
+    assert response.status_code == 422
+
+    error = response.json()["detail"][0]
+    assert error["loc"] == ["body", "edges", 0, "target"]
+    assert error["input"] == "missing"
+    assert "Unknown target node 'missing'" in error["msg"]
+
+
+def test_parse_pipeline_response_is_documented(client):
+    schema = client.get("/api/openapi.json").json()
+    responses = schema["paths"]["/pipelines/parse"]["post"]["responses"]
+
+    content = responses["200"]["content"]["application/json"]
+    assert content["schema"]["$ref"].endswith("/PipelineResponse")
+
+
+def test_parse_pipeline_caches_rejection(client):
+    # Large enough to pass CACHE_NEGATIVE_MIN_BYTES
+    node_ids = [f"rejected{i}" for i in range(200)]
+    payload = {
+        "nodes": [{"id": nid, "type": "node"} for nid in node_ids],
+        "edges": [{"source": "rejected0", "target": "rejected0"}],
+    }
+
+    first = client.post("/pipelines/parse", json=payload)
+    hits = rejections.hits
+    second = client.post("/pipelines/parse", json=payload)
+
+    assert first.status_code == 422
+    assert second.status_code == 422
+    assert second.json() == first.json()
+    assert rejections.hits == hits + 1
@@ -0,0 +1,34 @@
+# tests/test_rate_limiter.py
+
+from starlette.requests import Request
+from limits.storage import RedisStorage
+from app.core.rate_limiter import build_limiter, remote_address
+
+
+def make_request(scope_state=None):
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": [],
+        "client": ("10.0.0.7", 1234),
+    }
+    if scope_state is not None:
+        scope["state"] = scope_state
+    return Request(scope)
+
+
+def test_remote_address_uses_cached_value():
+    request = make_request({"remote_addr": "192.0.2.1"})
+    assert remote_address(request) == "192.0.2.1"
+
+
+def test_remote_address_falls_back_to_client():
+    assert remote_address(make_request()) == "10.0.0.7"
+
+
+def test_limiter_builds_redis_storage():
+    # The storage connects lazily, so no Redis server is needed here
+    limiter = build_limiter("redis://localhost:6379/0", "moving-window")
+
+    assert isinstance(limiter._storage, RedisStorage)